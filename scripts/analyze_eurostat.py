@@ -2,10 +2,16 @@
 """
 analyze_eurostat.py - Detailed analysis of Eurostat transport data
 """
+import numpy as np
 import pandas as pd
 import re
 from pathlib import Path
 
+from clean_eurostat import _STRING_DTYPE, buffered_output, split_metadata
+
+# Eurostat flags are lowercase letters, e.g. "16.4 e" or "0.0 n"
+_FLAG_RE = re.compile(r'[a-z :]+')
+
 
 def parse_eurostat_header(header_str):
     """Parse the Eurostat metadata column (freq,unit,tra_mode,geo\\TIME_PERIOD)"""
@@ -23,13 +29,103 @@ def clean_eurostat_value(value):
         return None
 
     # Remove common Eurostat flags
-    cleaned = re.sub(r'[a-z :]+', '', str(value).strip())
+    cleaned = _FLAG_RE.sub('', str(value))
     try:
         return float(cleaned)
     except ValueError:
         return None
 
 
+def clean_eurostat_frame(frame):
+    """Vectorized clean_eurostat_value over a whole block of year columns"""
+    block = frame.astype(_STRING_DTYPE)
+    block = block.apply(
+        lambda s: s.str.replace(_FLAG_RE.pattern, '', regex=True).mask(s.str.contains(':', regex=False))
+    )
+    return block.apply(pd.to_numeric, errors='coerce').astype('float64')
+
+
+# Cell classes for the data-quality scan ('e' wins over 'b', ':' wins over both)
+CELL_VALID, CELL_MISSING, CELL_ESTIMATED, CELL_BREAK = range(4)
+
+_classify_kernel = None
+NUMBA_MIN_CELLS = 20_000_000  # below this, the pandas masks beat joining the cells and loading the kernel
+
+
+def _get_classify_kernel():
+    """Numba kernel for count_cell_flags, compiled (or loaded from cache) on first use; None without numba"""
+    global _classify_kernel
+    if _classify_kernel is None:
+        try:
+            import numba  # imported lazily: only large inputs pay for it
+        except ImportError:
+            _classify_kernel = False
+        else:
+            @numba.njit(parallel=True, cache=True)
+            def kernel(buf, ends, out):
+                """Classify NUL-terminated cells in buf into CELL_* codes, one pass per cell"""
+                for i in numba.prange(len(ends)):
+                    start = ends[i - 1] + 1 if i > 0 else 0
+                    stop = ends[i]
+                    while start < stop and (buf[start] == 32 or 9 <= buf[start] <= 13):
+                        start += 1
+                    while stop > start and (buf[stop - 1] == 32 or 9 <= buf[stop - 1] <= 13):
+                        stop -= 1
+
+                    if stop == start or (stop - start == 3 and buf[start] == 110
+                                         and buf[start + 1] == 97 and buf[start + 2] == 110):
+                        out[i] = CELL_MISSING
+                        continue
+
+                    has_colon = has_e = has_b = False
+                    for j in range(start, stop):
+                        c = buf[j]
+                        if c == 58:
+                            has_colon = True
+                        elif c == 101:
+                            has_e = True
+                        elif c == 98:
+                            has_b = True
+
+                    if has_colon:
+                        out[i] = CELL_MISSING
+                    elif has_e:
+                        out[i] = CELL_ESTIMATED
+                    elif has_b:
+                        out[i] = CELL_BREAK
+                    else:
+                        out[i] = CELL_VALID
+            _classify_kernel = kernel
+    return _classify_kernel or None
+
+
+def count_cell_flags(frame):
+    """Return (missing, estimated, break) cell counts for a block of raw year columns"""
+    vals = frame.astype(_STRING_DTYPE).fillna('')
+
+    kernel = _get_classify_kernel() if vals.size >= NUMBA_MIN_CELLS else None
+    if kernel is not None:
+        cells = vals.to_numpy(dtype=object).ravel()
+        buf = np.frombuffer(('\0'.join(cells) + '\0').encode('utf-8'), dtype=np.uint8)
+        ends = np.flatnonzero(buf == 0)
+        if len(ends) == len(cells):  # no NUL inside any cell
+            out = np.empty(len(cells), dtype=np.int8)
+            kernel(buf, ends, out)
+            counts = np.bincount(out, minlength=4)
+            return int(counts[CELL_MISSING]), int(counts[CELL_ESTIMATED]), int(counts[CELL_BREAK])
+
+    # Column-wise boolean masks
+    vals = vals.apply(lambda s: s.str.strip())
+    missing = vals.eq('') | vals.eq('nan') | vals.apply(lambda s: s.str.contains(':', regex=False))
+    estimated = vals.apply(lambda s: s.str.contains('e', regex=False)) & ~missing
+    breaks = vals.apply(lambda s: s.str.contains('b', regex=False)) & ~missing & ~estimated
+
+    return (int(missing.to_numpy(dtype=bool).sum()),
+            int(estimated.to_numpy(dtype=bool).sum()),
+            int(breaks.to_numpy(dtype=bool).sum()))
+
+
+@buffered_output
 def analyze_eurostat_file(csv_path):
     """Comprehensive analysis of Eurostat transport data"""
 
@@ -54,19 +150,7 @@ def analyze_eurostat_file(csv_path):
     print("METADATA BREAKDOWN")
     print(f"{'='*80}\n")
 
-    parsed_data = []
-    for idx, row in df.iterrows():
-        meta_str = row[metadata_col]
-        parts = meta_str.split(',')
-        if len(parts) >= 4:
-            parsed_data.append({
-                'freq': parts[0],
-                'unit': parts[1],
-                'tra_mode': parts[2],
-                'geo': parts[3]
-            })
-
-    meta_df = pd.DataFrame(parsed_data)
+    meta_df = split_metadata(df[metadata_col])
 
     print("Frequency (freq):")
     print(meta_df['freq'].value_counts().to_string())
@@ -88,26 +172,9 @@ def analyze_eurostat_file(csv_path):
     print(f"{'='*80}\n")
 
     # Count missing values, estimated values, breaks in series
-    missing_count = 0
-    estimated_count = 0
-    break_count = 0
-    valid_count = 0
-
-    for col in year_cols:
-        for val in df[col]:
-            val_str = str(val).strip()
-            if ':' in val_str or val_str == 'nan' or val_str == '':
-                missing_count += 1
-            elif 'e' in val_str:
-                estimated_count += 1
-                valid_count += 1
-            elif 'b' in val_str:
-                break_count += 1
-                valid_count += 1
-            else:
-                valid_count += 1
-
     total_cells = len(df) * len(year_cols)
+    missing_count, estimated_count, break_count = count_cell_flags(df[year_cols])
+    valid_count = total_cells - missing_count
 
     print(f"Total data cells: {total_cells}")
     print(f"  Valid values: {valid_count} ({valid_count/total_cells*100:.1f}%)")
@@ -120,14 +187,14 @@ def analyze_eurostat_file(csv_path):
     print("SAMPLE DATA BY COUNTRY (First 10 countries)")
     print(f"{'='*80}\n")
 
-    for idx in range(min(10, len(df))):
-        row = df.iloc[idx]
-        meta = row[metadata_col]
-        country = meta.split(',')[-1] if ',' in meta else 'Unknown'
+    # Show last 3 years
+    head = df.head(10)
+    recent_years = year_cols[-3:]
+    metas = head[metadata_col].to_numpy()
+    recent = head[recent_years].to_numpy()
 
-        # Show last 3 years
-        recent_years = year_cols[-3:]
-        recent_values = [row[year] for year in recent_years]
+    for meta, recent_values in zip(metas, recent):
+        country = meta.split(',')[-1] if ',' in meta else 'Unknown'
 
         print(f"{country:4s}: ", end='')
         for year, val in zip(recent_years, recent_values):
@@ -139,17 +206,17 @@ def analyze_eurostat_file(csv_path):
     print("NUMERIC STATISTICS (Cleaned Data)")
     print(f"{'='*80}\n")
 
-    numeric_df = df[year_cols].applymap(clean_eurostat_value)
+    numeric_df = clean_eurostat_frame(df[year_cols])
 
     print("Year-by-year statistics:")
     print(f"{'Year':<8} {'Count':>8} {'Mean':>10} {'Median':>10} {'Min':>10} {'Max':>10}")
     print("-" * 66)
 
-    for year in year_cols:
-        values = numeric_df[year].dropna()
-        if len(values) > 0:
-            print(f"{year:<8} {len(values):>8} {values.mean():>10.2f} "
-                  f"{values.median():>10.2f} {values.min():>10.2f} {values.max():>10.2f}")
+    year_stats = numeric_df.agg(['count', 'mean', 'median', 'min', 'max']).T
+    for year, count, mean, median, vmin, vmax in year_stats.itertuples():
+        if count > 0:
+            print(f"{year:<8} {int(count):>8} {mean:>10.2f} "
+                  f"{median:>10.2f} {vmin:>10.2f} {vmax:>10.2f}")
 
     # Trend analysis
     print(f"\n{'='*80}")
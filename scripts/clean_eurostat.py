@@ -13,12 +13,66 @@ Features:
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import io
 import re
+import sys
 from pathlib import Path
 from typing import List, Optional, Dict, Any
+import numpy as np
 import pandas as pd
 
 
+# Letter flags and the spaces/colons around them, e.g. "16.4 e" or ": m"
+_FLAG_RE = re.compile(r'[A-Za-z :]+')
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    # Arrow-backed strings run regex replaces in RE2 (a DFA) instead of Python's re
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pa = pa_csv = None
+    _STRING_DTYPE = 'string'
+
+# Cleaned frames are cached here, keyed by input path, mtime and size
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'eurostat'
+# Bump when the cached frame's layout or dtypes change, so old cache files are not reused
+CACHE_FORMAT = 2
+
+
+def buffered_output(func):
+    """Collect everything func prints and write it to stdout in a single call"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buf):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+    return wrapper
+
+
+def split_metadata(meta: pd.Series) -> pd.DataFrame:
+    """Split Eurostat metadata strings ("freq,unit,tra_mode,geo\\TIME_PERIOD") into columns"""
+    # Split all rows at once; rows with fewer than 4 fields are dropped. Columns the
+    # split never produced come back as float NaN, so cast them to strings for .str
+    parts = meta.astype(_STRING_DTYPE).str.split(',', n=3, expand=True)
+    parts = parts.reindex(columns=range(4)).astype(_STRING_DTYPE)
+    parts = parts[parts[3].notna()]
+
+    # Columns straight from arrays: no per-column index alignment
+    return pd.DataFrame({
+        'freq': parts[0].str.strip().to_numpy(),
+        'unit': parts[1].str.strip().to_numpy(),
+        'tra_mode': parts[2].str.strip().to_numpy(),
+        'geo': parts[3].str.split('\\', n=1).str[0].str.strip().to_numpy()
+    }, index=parts.index)
+
+
 class EurostatCleaner:
     """Clean and process Eurostat transport data"""
 
@@ -39,9 +93,24 @@ class EurostatCleaner:
         'm': 'missing'
     }
 
-    def __init__(self, csv_path: Path):
-        """Initialize with path to converted CSV file"""
+    # Dimensions packed into the first column ("freq,unit,tra_mode,geo\\TIME_PERIOD")
+    META_COLS = ['freq', 'unit', 'tra_mode', 'geo']
+
+    def __init__(self, csv_path: Path, chunksize: Optional[int] = None,
+                 cache_dir: Optional[Path] = None):
+        """
+        Initialize with path to converted CSV file
+
+        Args:
+            csv_path: Eurostat CSV file
+            chunksize: Stream the CSV in chunks of this many rows
+            cache_dir: Reuse/store the cleaned data here (disabled if None)
+        """
         self.csv_path = csv_path
+        self.chunksize = chunksize
+        self.cache_dir = cache_dir
+        self.cache_path = None
+        self._cached_df = None
         self.df = None
         self.metadata_col = None
         self.year_cols = None
@@ -49,33 +118,96 @@ class EurostatCleaner:
         self.long_df = None
 
     def load_data(self):
-        """Load the Eurostat CSV file"""
-        print(f"Loading data from: {self.csv_path}")
-        self.df = pd.read_csv(self.csv_path)
-        self.metadata_col = self.df.columns[0]
-        # Store cleaned year column names
-        self.year_cols = [col.strip() for col in self.df.columns[1:]]
-        print(f"  Loaded {len(self.df)} rows, {len(self.year_cols)} years ({self.year_cols[0]}-{self.year_cols[-1]})")
+        """Load the Eurostat CSV file (only its header when streaming in chunks)"""
+        if self.cache_dir is not None:
+            stat = self.csv_path.stat()
+            key = f"{self.csv_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{CACHE_FORMAT}"
+            self.cache_path = self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.feather"
+
+            if self.cache_path.exists():
+                try:
+                    self._cached_df = pd.read_feather(self.cache_path)
+                except (ImportError, OSError, ValueError) as e:
+                    # Truncated or corrupt cache: rebuild it from the CSV
+                    print(f"  Warning: ignoring unreadable cache {self.cache_path}: {e}")
+                else:
+                    print(f"Loading cached data for: {self.csv_path}")
+                    # Columns: row_idx, META_COLS, years
+                    self.year_cols = list(self._cached_df.columns[1 + len(self.META_COLS):])
+                    print(f"  Loaded {len(self._cached_df)} rows, {len(self.year_cols)} years ({self.year_cols[0]}-{self.year_cols[-1]})")
+                    return
+
+        if self.chunksize:
+            print(f"Streaming data from: {self.csv_path} ({self.chunksize} rows per chunk)")
+            columns = pd.read_csv(self.csv_path, nrows=0).columns
+        else:
+            print(f"Loading data from: {self.csv_path}")
+            # Everything is text until cleaned: year cells carry flags like '16.4 e'
+            self.df = self._read_csv()
+            columns = self.df.columns
+
+        self.metadata_col = columns[0]
+        # Strip year headers ("2005 ") once; every frame is renamed to match
+        self.year_cols = [col.strip() for col in columns[1:]]
+        if self.df is not None:
+            self.df.columns = [self.metadata_col] + self.year_cols
+            print(f"  Loaded {len(self.df)} rows, {len(self.year_cols)} years ({self.year_cols[0]}-{self.year_cols[-1]})")
+        else:
+            print(f"  Found {len(self.year_cols)} years ({self.year_cols[0]}-{self.year_cols[-1]})")
+
+    def _read_csv(self) -> pd.DataFrame:
+        """Read the whole CSV as strings, with pyarrow's multi-threaded reader when available"""
+        if pa_csv is None:
+            return pd.read_csv(self.csv_path, dtype=_STRING_DTYPE)
+
+        columns = pd.read_csv(self.csv_path, nrows=0).columns
+        table = pa_csv.read_csv(
+            self.csv_path,
+            convert_options=pa_csv.ConvertOptions(column_types={col: pa.string() for col in columns})
+        )
+        return table.to_pandas(types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get)
+
+    def iter_frames(self):
+        """Yield the loaded data, or successive chunks of the CSV when streaming"""
+        if self.df is not None:
+            yield self.df
+        else:
+            for chunk in pd.read_csv(self.csv_path, dtype=_STRING_DTYPE, chunksize=self.chunksize):
+                chunk.columns = [self.metadata_col] + self.year_cols
+                yield chunk
+
+    def _split_metadata(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Split the metadata column of one frame into row_idx and META_COLS"""
+        meta_df = split_metadata(frame[self.metadata_col])
+        meta_df.insert(0, 'row_idx', meta_df.index.to_numpy())
+        return meta_df
+
+    def _to_categories(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Store the low-cardinality META_COLS as integer-coded categoricals"""
+        for col in self.META_COLS:
+            df[col] = df[col].astype('category')
+        return df
+
+    def _clean_years(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Clean all year columns of one frame in a vectorized pass (same rules as clean_value)"""
+        year_block = frame[self.year_cols].astype(_STRING_DTYPE)
+        # Pass the pattern text: a compiled pattern forces pandas onto Python's re
+        year_block = year_block.apply(lambda s: s.str.replace(_FLAG_RE.pattern, '', regex=True))
+        # Keep float64: float32 would round exported values (123456789 -> 1.2345679e+08) and the stats
+        return year_block.apply(pd.to_numeric, errors='coerce').astype('float64')
 
     def parse_metadata(self) -> pd.DataFrame:
         """Parse metadata column into separate fields"""
         print("\nParsing metadata...")
 
-        parsed = []
-        for idx, row in self.df.iterrows():
-            meta_str = row[self.metadata_col]
-            parts = meta_str.split(',')
-
-            if len(parts) >= 4:
-                parsed.append({
-                    'row_idx': idx,
-                    'freq': parts[0].strip(),
-                    'unit': parts[1].strip(),
-                    'tra_mode': parts[2].strip(),
-                    'geo': parts[3].strip()
-                })
-
-        meta_df = pd.DataFrame(parsed)
+        # Cleaned (or cached) data already holds the parsed fields
+        cleaned = self.cleaned_df if self.cleaned_df is not None else self._cached_df
+        if cleaned is not None:
+            meta_df = cleaned[['row_idx'] + self.META_COLS]
+        else:
+            meta_df = pd.concat([self._split_metadata(frame) for frame in self.iter_frames()])
+            meta_df = self._to_categories(meta_df)
+
         print(f"  Parsed metadata for {len(meta_df)} rows")
         return meta_df
 
@@ -90,14 +222,8 @@ class EurostatCleaner:
         if pd.isna(value):
             return None
 
-        value_str = str(value).strip()
-
-        # Handle missing values
-        if value_str in ['', ':', ': m', ': c', ': z']:
-            return None
-
-        # Remove all letter flags and extra spaces
-        cleaned = re.sub(r'[a-zA-Z :]+', '', value_str)
+        # Remove all letter flags and extra spaces (missing markers like ': m' become empty)
+        cleaned = _FLAG_RE.sub('', str(value))
 
         # Try to convert to float
         try:
@@ -118,15 +244,21 @@ class EurostatCleaner:
         """Clean all numeric values and create cleaned dataframe"""
         print("\nCleaning data values...")
 
-        meta_df = self.parse_metadata()
+        if self._cached_df is not None:
+            cleaned = self._cached_df
+        else:
+            # One frame, or one chunk at a time when streaming
+            pieces = []
+            for frame in self.iter_frames():
+                meta_df = self._split_metadata(frame)
+                year_block = self._clean_years(frame)
+                pieces.append(pd.concat([meta_df, year_block.loc[meta_df.index]], axis=1))
 
-        # Create cleaned dataframe with metadata
-        cleaned = meta_df.copy()
+            cleaned = self._to_categories(pd.concat(pieces))
+            print(f"  Parsed metadata for {len(cleaned)} rows")
 
-        # Clean year columns - handle both original and stripped names
-        for year_col in self.df.columns[1:]:
-            year_clean = year_col.strip()
-            cleaned[year_clean] = self.df[year_col].apply(self.clean_value)
+            if self.cache_path is not None:
+                self._write_cache(cleaned)
 
         self.cleaned_df = cleaned
 
@@ -140,6 +272,22 @@ class EurostatCleaner:
 
         return cleaned
 
+    def _write_cache(self, cleaned: pd.DataFrame):
+        """Store the cleaned frame as Feather (keeps float64 and categorical dtypes)"""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cleaned.reset_index(drop=True).to_feather(self.cache_path)
+        except (ImportError, OSError) as e:
+            print(f"  Warning: could not write cache {self.cache_path}: {e}")
+
+    def _category_mask(self, col: str, values: List[str]) -> np.ndarray:
+        """Case-insensitive isin on a categorical column, matched once per category"""
+        series = self.cleaned_df[col]
+        keep = series.cat.categories.str.upper().isin([v.upper() for v in values])
+        codes = series.cat.codes.to_numpy()
+        # Code -1 marks a missing value
+        return keep[codes] & (codes >= 0)
+
     def filter_geo(self, countries: List[str]) -> 'EurostatCleaner':
         """Filter data to specific countries"""
         if self.cleaned_df is None:
@@ -148,8 +296,7 @@ class EurostatCleaner:
         print(f"\nFiltering to countries: {', '.join(countries)}")
 
         # Case-insensitive matching
-        countries_upper = [c.upper() for c in countries]
-        mask = self.cleaned_df['geo'].str.upper().isin(countries_upper)
+        mask = self._category_mask('geo', countries)
 
         self.cleaned_df = self.cleaned_df[mask].copy()
         print(f"  Retained {len(self.cleaned_df)} rows")
@@ -163,8 +310,7 @@ class EurostatCleaner:
 
         print(f"\nFiltering to transport modes: {', '.join(modes)}")
 
-        modes_upper = [m.upper() for m in modes]
-        mask = self.cleaned_df['tra_mode'].str.upper().isin(modes_upper)
+        mask = self._category_mask('tra_mode', modes)
 
         self.cleaned_df = self.cleaned_df[mask].copy()
         print(f"  Retained {len(self.cleaned_df)} rows")
@@ -183,31 +329,31 @@ class EurostatCleaner:
         if self.cleaned_df is None:
             raise ValueError("Must clean data first (call clean_data())")
 
-        # Metadata columns
-        id_vars = ['freq', 'unit', 'tra_mode', 'geo']
-
-        # Melt the dataframe
-        long_df = self.cleaned_df.melt(
-            id_vars=id_vars,
-            value_vars=self.year_cols,
-            var_name='year',
-            value_name='value'
-        )
-
-        # Convert year to int
-        long_df['year'] = long_df['year'].astype(int)
-
-        # Remove rows with null values
-        long_df = long_df.dropna(subset=['value'])
-
-        # Sort
-        long_df = long_df.sort_values(['geo', 'tra_mode', 'year']).reset_index(drop=True)
+        # Positions of the non-null observations, in row-major order
+        values = self.cleaned_df[self.year_cols].to_numpy(dtype='float64')
+        row_idx, col_idx = np.nonzero(~np.isnan(values))
+
+        # Build each long column directly (metadata stays categorical)
+        long_df = pd.DataFrame({
+            col: self.cleaned_df[col].array.take(row_idx) for col in self.META_COLS
+        })
+        long_df['year'] = np.asarray(self.year_cols, dtype='int16')[col_idx]
+        long_df['value'] = values[row_idx, col_idx]
+
+        # Sort by geo, tra_mode, year on integer category codes
+        order = np.lexsort((
+            long_df['year'].to_numpy(),
+            long_df['tra_mode'].cat.codes.to_numpy(),
+            long_df['geo'].cat.codes.to_numpy()
+        ))
+        long_df = long_df.take(order).reset_index(drop=True)
 
         self.long_df = long_df
 
         print(f"  Created long format with {len(long_df)} rows")
         return long_df
 
+    @buffered_output
     def summary_stats(self) -> pd.DataFrame:
         """Generate summary statistics"""
         if self.cleaned_df is None:
@@ -223,50 +369,32 @@ class EurostatCleaner:
         print(f"  Transport modes: {self.cleaned_df['tra_mode'].nunique()}")
         print(f"  Years: {len(self.year_cols)}")
 
+        # One long frame of non-null observations feeds both groupings
+        long = self.cleaned_df.melt(
+            id_vars=['geo', 'tra_mode'],
+            value_vars=self.year_cols,
+            value_name='value'
+        ).dropna(subset=['value'])
+        aggs = ['count', 'mean', 'median', 'min', 'max']
+        stat_names = ['Data Points', 'Mean', 'Median', 'Min', 'Max']
+
         # By country
         print(f"\nData by Country:")
-        country_stats = []
-        for geo in sorted(self.cleaned_df['geo'].unique()):
-            geo_data = self.cleaned_df[self.cleaned_df['geo'] == geo]
-            values = geo_data[self.year_cols].values.flatten()
-            values = values[~pd.isna(values)]
-
-            if len(values) > 0:
-                country_stats.append({
-                    'Country': geo,
-                    'Data Points': len(values),
-                    'Mean': values.mean(),
-                    'Median': pd.Series(values).median(),
-                    'Min': values.min(),
-                    'Max': values.max()
-                })
-
-        stats_df = pd.DataFrame(country_stats)
+        stats_df = long.groupby('geo', observed=True)['value'].agg(aggs)
+        stats_df.columns = stat_names
+        stats_df = stats_df.rename_axis('Country').reset_index()
         print(stats_df.to_string(index=False))
 
         # By transport mode
         print(f"\nData by Transport Mode:")
-        mode_stats = []
-        for mode in sorted(self.cleaned_df['tra_mode'].unique()):
-            mode_data = self.cleaned_df[self.cleaned_df['tra_mode'] == mode]
-            values = mode_data[self.year_cols].values.flatten()
-            values = values[~pd.isna(values)]
-
-            if len(values) > 0:
-                mode_stats.append({
-                    'Transport Mode': mode,
-                    'Data Points': len(values),
-                    'Mean': values.mean(),
-                    'Median': pd.Series(values).median(),
-                    'Min': values.min(),
-                    'Max': values.max()
-                })
-
-        mode_df = pd.DataFrame(mode_stats)
+        mode_df = long.groupby('tra_mode', observed=True)['value'].agg(aggs)
+        mode_df.columns = stat_names
+        mode_df = mode_df.rename_axis('Transport Mode').reset_index()
         print(mode_df.to_string(index=False))
 
         return stats_df
 
+    @buffered_output
     def analyze_trends(self):
         """Analyze trends over time"""
         if self.cleaned_df is None:
@@ -281,11 +409,11 @@ class EurostatCleaner:
         print(f"{'Year':<8} {'Count':>8} {'Mean':>10} {'Median':>10} {'Std Dev':>10}")
         print("-" * 56)
 
-        for year in self.year_cols:
-            values = self.cleaned_df[year].dropna()
-            if len(values) > 0:
-                print(f"{year:<8} {len(values):>8} {values.mean():>10.2f} "
-                      f"{values.median():>10.2f} {values.std():>10.2f}")
+        stats = self.cleaned_df[self.year_cols].agg(['count', 'mean', 'median', 'std']).T
+        for year, count, mean, median, std in stats.itertuples():
+            if count > 0:
+                print(f"{year:<8} {int(count):>8} {mean:>10.2f} "
+                      f"{median:>10.2f} {std:>10.2f}")
 
         # Overall trend
         first_year = self.year_cols[0]
@@ -312,6 +440,9 @@ class EurostatCleaner:
 
         if output_path.suffix == '.xlsx':
             self.cleaned_df.to_excel(output_path, index=False)
+        elif output_path.suffix == '.parquet':
+            # Categorical metadata is written dictionary-encoded
+            self.cleaned_df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
         else:
             self.cleaned_df.to_csv(output_path, index=False)
 
@@ -326,6 +457,9 @@ class EurostatCleaner:
 
         if output_path.suffix == '.xlsx':
             self.long_df.to_excel(output_path, index=False)
+        elif output_path.suffix == '.parquet':
+            # Categorical metadata is written dictionary-encoded
+            self.long_df.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
         else:
             self.long_df.to_csv(output_path, index=False)
 
@@ -360,7 +494,7 @@ def main():
     parser.add_argument(
         '-o', '--output',
         type=Path,
-        help='Output file for cleaned data (CSV or XLSX)'
+        help='Output file for cleaned data (CSV, XLSX or Parquet)'
     )
 
     parser.add_argument(
@@ -369,6 +503,18 @@ def main():
         help='Export in long format (one row per observation)'
     )
 
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        help='Stream the input in chunks of N rows (for very large files)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Do not reuse or store cleaned data in {DEFAULT_CACHE_DIR}'
+    )
+
     parser.add_argument(
         '--stats',
         action='store_true',
@@ -389,7 +535,11 @@ def main():
         return 1
 
     # Initialize cleaner
-    cleaner = EurostatCleaner(args.input)
+    cleaner = EurostatCleaner(
+        args.input,
+        chunksize=args.chunksize,
+        cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR
+    )
 
     # Load and clean
     cleaner.load_data()
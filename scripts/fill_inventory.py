@@ -9,7 +9,10 @@ fill_inventory.py — Guided CLI to complete missing fields in Data_Inventory sh
 import argparse, re, sys
 from pathlib import Path
 from urllib.parse import urlparse
+import numpy as np
+import openpyxl
 import pandas as pd
+import xlsxwriter
 import yaml
 
 ENUM_COLUMNS = {
@@ -32,6 +35,9 @@ ENUM_COLUMNS = {
     "priority (A/B/C)": ["A","B","C"]
 }
 
+# Lowercased option -> canonical spelling, per enum column
+_ENUM_LUT = {col: {opt.lower(): opt for opt in allowed} for col, allowed in ENUM_COLUMNS.items()}
+
 QUALITY_COLUMNS = [
     "quality_completeness (0-3)",
     "quality_accuracy (0-3)",
@@ -49,8 +55,13 @@ REQ_COLUMNS = [
     "update_frequency (realtime/daily/weekly/monthly/quarterly/annual/ad-hoc)",
 ]
 
-EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\\.[^@\\s]+$")
-DATE_RE = re.compile(r"^\\d{4}(-\\d{2}(-\\d{2})?)?$")  # YYYY or YYYY-MM or YYYY-MM-DD
+EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+", re.ASCII)
+DATE_RE = re.compile(r"\d{4}(-\d{2}(-\d{2})?)?", re.ASCII)  # YYYY or YYYY-MM or YYYY-MM-DD
+
+OFFICIAL_HOST_RE = re.compile(r"statbel|bestat|economie\.fgov|eurostat|oecd|worldbank|data\.gov")
+SECTOR_HOST_RE = re.compile(r"itb|sector|binnenvaart|inlandwaterway|barge|rederij|bevrachting")
+# Host of scheme://[user@]host[:port]/... (or //host/...), as urlparse().hostname
+URL_HOST_RE = re.compile(r"^(?:[A-Za-z][A-Za-z0-9+.-]*:)?//(?:[^@/?#]*@)?([^/?#:]*)")
 
 def guess_source_type(url: str) -> str | None:
     try:
@@ -58,42 +69,50 @@ def guess_source_type(url: str) -> str | None:
     except Exception:
         return None
     host = host.lower()
-    if any(k in host for k in ["statbel","bestat","economie.fgov","eurostat","oecd","worldbank","data.gov"]):
+    if OFFICIAL_HOST_RE.search(host):
         return "official"
-    if any(k in host for k in ["itb","sector","binnenvaart","inlandwaterway","barge","rederij","bevrachting"]):
+    if SECTOR_HOST_RE.search(host):
         return "sector"
     return None
 
+def guess_source_types(urls: pd.Series) -> pd.Series:
+    # Vectorized guess_source_type: one regex pass per category over the whole column
+    hosts = urls.astype("string").str.strip().str.extract(URL_HOST_RE.pattern, expand=False).str.lower()
+    official = hosts.str.contains(OFFICIAL_HOST_RE.pattern, na=False).to_numpy(dtype=bool)
+    sector = hosts.str.contains(SECTOR_HOST_RE.pattern, na=False).to_numpy(dtype=bool)
+    return pd.Series(np.select([official, sector], ["official", "sector"], default=None), index=urls.index)
+
 def coerce_enum(value, allowed):
+    # allowed: list of options, or a precomputed {lowercase: option} lookup (see _ENUM_LUT)
     if pd.isna(value) or value == "":
         return None
-    s = str(value).strip()
-    for opt in allowed:
-        if s.lower() == opt.lower():
-            return opt
-    return None
+    lut = allowed if isinstance(allowed, dict) else {opt.lower(): opt for opt in allowed}
+    return lut.get(str(value).strip().lower())
 
 def input_enum(prompt, allowed):
+    lut = {opt.lower(): opt for opt in allowed}
+    full_prompt = f"{prompt} {allowed} > "
     while True:
-        val = input(f"{prompt} {allowed} > ").strip()
+        val = input(full_prompt).strip()
         if val == "": 
             return None
-        coerced = coerce_enum(val, allowed)
+        coerced = coerce_enum(val, lut)
         if coerced is not None:
             return coerced
         print(f"Value must be one of {allowed}. Try again.")
 
 def input_text(prompt, validator=None, hint=None):
+    full_prompt = f"{prompt}{' ['+hint+']' if hint else ''} > "
     while True:
-        val = input(f"{prompt}{' ['+hint+']' if hint else ''} > ").strip()
+        val = input(full_prompt).strip()
         if val == "":
             return None
         if validator is None or validator(val):
             return val
         print("Invalid value. Try again.")
 
-def is_email(s:str)->bool: return EMAIL_RE.match(s) is not None
-def is_date(s:str)->bool: return DATE_RE.match(s) is not None
+def is_email(s:str)->bool: return EMAIL_RE.fullmatch(s) is not None
+def is_date(s:str)->bool: return DATE_RE.fullmatch(s) is not None
 def is_url(s:str)->bool:
     try:
         p = urlparse(s)
@@ -101,18 +120,135 @@ def is_url(s:str)->bool:
     except Exception:
         return False
 
-def compute_quality_total(row: pd.Series) -> int:
-    total = 0
-    for c in QUALITY_COLUMNS:
-        try:
-            v = int(row.get(c,0)) if pd.notna(row.get(c)) else 0
-            if 0 <= v <= 3:
-                total += v
-        except Exception:
-            pass
-    return total
-
-def bulk_fill(df: pd.DataFrame, col: str):
+def compute_quality_totals(df: pd.DataFrame) -> pd.Series:
+    # Sum of the integer quality_* scores per row; blanks, non-numbers and values outside 0-3 count as 0
+    q = np.trunc(df[QUALITY_COLUMNS].apply(pd.to_numeric, errors="coerce"))
+    q = q.where((q >= 0) & (q <= 3), 0)
+    return q.sum(axis=1).astype("int16")
+
+def trim_row(row) -> list:
+    # Row values without trailing empty cells
+    row = list(row)
+    while row and row[-1] is None:
+        row.pop()
+    return row
+
+def iter_sheet_chunks(ws, n: int = 50_000):
+    # Stream a read-only worksheet as DataFrames of at most n rows (header = first row).
+    # Runs of empty rows are held back until a non-empty row follows, so trailing blanks are dropped.
+    # Like pandas: forget the stored <dimension> (other tools may write a stale one that cuts
+    # off rows/columns), trim trailing empty cells and pad rows to the widest row seen so far.
+    ws.reset_dimensions()
+    rows = ws.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        yield pd.DataFrame()
+        return
+    columns = [c if c is not None else f"Unnamed: {i}" for i, c in enumerate(trim_row(header))]
+
+    def frame(records):
+        # Rows wider than the header get "Unnamed: i" columns, as in pd.read_excel
+        width = max([len(columns)] + [len(r) for r in records])
+        columns.extend(f"Unnamed: {i}" for i in range(len(columns), width))
+        return pd.DataFrame.from_records([r + [None] * (width - len(r)) for r in records], columns=columns)
+
+    chunk, blanks, emitted = [], [], False
+    for row in rows:
+        row = trim_row(row)
+        if not row:
+            blanks.append(row)
+            continue
+        if blanks:
+            chunk.extend(blanks)
+            blanks = []
+        chunk.append(row)
+        if len(chunk) >= n:
+            yield frame(chunk[:n])
+            chunk, emitted = chunk[n:], True
+    while len(chunk) > n:
+        yield frame(chunk[:n])
+        chunk, emitted = chunk[n:], True
+    if chunk or not emitted:
+        yield frame(chunk)
+
+def read_sheet(wb, name: str) -> pd.DataFrame:
+    # Stream one sheet of a read-only workbook into a DataFrame (header = first row)
+    chunks = list(iter_sheet_chunks(wb[name]))
+    return chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+
+def enrich(df: pd.DataFrame) -> pd.DataFrame:
+    # Row-local clean-up: blanks -> NaN, enum coercion, source_type guess, quality_total
+    # Standardize empty strings to NaN (vectorized per text column; other values untouched)
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        blank = df[col].astype("string").str.strip().eq("").fillna(False)
+        df[col] = df[col].mask(blank)
+
+    # Enum coercion + soft guesses
+    for col, lut in _ENUM_LUT.items():
+        if col in df.columns:
+            s = df[col].astype("string").str.strip().str.lower()
+            df[col] = s.map(lut).where(s.notna(), df[col])
+
+    # Guess source_type from URL if missing
+    if "source_type (official/sector/commercial)" in df.columns and "url_or_access_method" in df.columns:
+        mask = df["source_type (official/sector/commercial)"].isna()
+        df.loc[mask, "source_type (official/sector/commercial)"] = guess_source_types(df.loc[mask, "url_or_access_method"])
+
+    # Compute quality_total
+    if all(c in df.columns for c in QUALITY_COLUMNS):
+        df["quality_total (0-21)"] = compute_quality_totals(df)
+    return df
+
+def report(columns, null_counts: pd.Series):
+    # Validate required columns
+    # warn if some expected columns are absent but do not abort
+    missing_req = [c for c in REQ_COLUMNS if c not in columns]
+    if missing_req:
+        print("WARN: Missing expected columns:", missing_req, file=sys.stderr)
+
+    # Quick diagnostics
+    print("\\n=== Diagnostics ===")
+    for c in [c for c in REQ_COLUMNS if c in columns]:
+        print(f"{c}: {null_counts[c]} empty")
+
+def write_frame(ws, frame: pd.DataFrame, startrow: int = 0, header_fmt=None) -> int:
+    # Write a frame row by row (constant_memory worksheets only accept rows in order);
+    # header is written when header_fmt is given. Returns the next free row.
+    if header_fmt is not None:
+        ws.write_row(startrow, 0, [str(c) for c in frame.columns], header_fmt)
+        startrow += 1
+    for r, row in enumerate(frame.astype(object).where(frame.notna(), None).to_numpy().tolist(), startrow):
+        ws.write_row(r, 0, row)
+    return startrow + len(frame)
+
+def open_output(out_path: Path, wb, sheet: str):
+    # Output workbook in constant_memory mode (each row is flushed to disk as written),
+    # with every sheet except the edited one copied through unchanged
+    book = xlsxwriter.Workbook(out_path, {"constant_memory": True,
+                                          "default_date_format": "yyyy-mm-dd hh:mm:ss"})
+    header_fmt = book.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+    for name in wb.sheetnames:
+        if name != sheet:
+            write_frame(book.add_worksheet(name), read_sheet(wb, name), header_fmt=header_fmt)
+    return book, header_fmt
+
+def run_chunked(wb, sheet: str, out_path: Path, n: int):
+    # Enrich and write the inventory chunk by chunk, so peak memory is bounded by one chunk
+    book, header_fmt = open_output(out_path, wb, sheet)
+    ws = book.add_worksheet(sheet)
+    null_counts, columns, row = None, [], 0
+    for i, chunk in enumerate(iter_sheet_chunks(wb[sheet], n)):
+        chunk = enrich(chunk)
+        row = write_frame(ws, chunk, row, header_fmt if i == 0 else None)
+        nulls = chunk.isna().sum()
+        null_counts = nulls if null_counts is None else null_counts.add(nulls, fill_value=0).astype(int)
+        columns = list(chunk.columns)
+        print(f"  {row - 1} rows written")
+    book.close()
+    report(columns, null_counts)
+
+def bulk_fill(df: pd.DataFrame, col: str) -> int:
+    # Returns the number of cells filled
     print(f"\\nBulk-fill column: {col}")
     if col in ENUM_COLUMNS:
         val = input_enum(f"Set a single value for all empty cells in '{col}':", ENUM_COLUMNS[col])
@@ -131,8 +267,11 @@ def bulk_fill(df: pd.DataFrame, col: str):
         val = input_text(f"Set a URL for all empty cells in '{col}':", is_url, "https://...")
     else:
         val = input_text(f"Set a text for all empty cells in '{col}':")
-    if val is not None:
-        df.loc[df[col].isna() | (df[col]==""), col] = val
+    if val is None:
+        return 0
+    empty = df[col].isna()  # blanks were normalized to NaN by enrich()
+    df.loc[empty, col] = val
+    return int(empty.sum())
 
 def main():
     ap = argparse.ArgumentParser()
@@ -140,58 +279,39 @@ def main():
     ap.add_argument("--sheet", default="Data_Inventory")
     ap.add_argument("--out-xlsx", help="Output path (default: <in>_filled.xlsx)")
     ap.add_argument("--no-cli", action="store_true", help="Run validations, enrich, and write output without interactive prompts")
+    ap.add_argument("--chunk-rows", type=int, help="Process the sheet N rows at a time to bound memory (requires --no-cli)")
     args = ap.parse_args()
+    if args.chunk_rows and not args.no_cli:
+        ap.error("--chunk-rows requires --no-cli")
 
     in_path = Path(args.in_xlsx)
     out_path = Path(args.out_xlsx) if args.out_xlsx else in_path.with_name(in_path.stem + "_filled.xlsx")
 
-    xls = pd.ExcelFile(in_path)
-    if args.sheet not in xls.sheet_names:
-        print(f"Sheet '{args.sheet}' not found. Available: {xls.sheet_names}", file=sys.stderr)
+    wb = openpyxl.load_workbook(in_path, read_only=True, data_only=True)
+    if args.sheet not in wb.sheetnames:
+        print(f"Sheet '{args.sheet}' not found. Available: {wb.sheetnames}", file=sys.stderr)
         sys.exit(2)
-    df = xls.parse(args.sheet)
-
-    # Standardize empty strings to NaN
-    df = df.applymap(lambda x: (None if (isinstance(x,str) and x.strip()=="") else x))
+    if args.chunk_rows:
+        run_chunked(wb, args.sheet, out_path, args.chunk_rows)
+        wb.close()
+        print(f"\\nSaved: {out_path}")
+        return
 
-    # Enum coercion + soft guesses
-    for col, allowed in ENUM_COLUMNS.items():
-        if col in df.columns:
-            df[col] = df[col].apply(lambda v: coerce_enum(v, allowed) if pd.notna(v) else v)
-
-    # Guess source_type from URL if missing
-    if "source_type (official/sector/commercial)" in df.columns and "url_or_access_method" in df.columns:
-        mask = df["source_type (official/sector/commercial)"].isna()
-        df.loc[mask, "source_type (official/sector/commercial)"] = df.loc[mask, "url_or_access_method"].apply(guess_source_type)
-
-    # Compute quality_total
-    if all(c in df.columns for c in QUALITY_COLUMNS):
-        df["quality_total (0-21)"] = df.apply(compute_quality_total, axis=1)
-
-    # Validate required columns
-    present_req = [c for c in REQ_COLUMNS if c in df.columns]
-    # warn if some expected columns are absent but do not abort
-    missing_req = [c for c in REQ_COLUMNS if c not in df.columns]
-    if missing_req:
-        print("WARN: Missing expected columns:", missing_req, file=sys.stderr)
-
-    # Quick diagnostics
-    print("\\n=== Diagnostics ===")
-    for c in [c for c in REQ_COLUMNS if c in df.columns]:
-        nnull = df[c].isna().sum()
-        print(f"{c}: {nnull} empty")
+    df = enrich(read_sheet(wb, args.sheet))
+    null_counts = df.isna().sum()
+    report(df.columns, null_counts)
 
     # Interactive filling loop
     if not args.no_cli:
         while True:
-            # Show columns with missing values
-            null_counts = df.isna().sum().sort_values(ascending=False)
-            todo = [c for c in null_counts.index if null_counts[c] > 0]
+            # Show columns with missing values (null_counts is kept up to date by the edits below)
+            # only the top 20 are listed, so a partial selection is enough
+            todo = null_counts[null_counts > 0].nlargest(20).index.tolist()
             if not todo:
                 print("\\nAll fields are filled (no NaNs).")
                 break
             print("\\nColumns with missing values (descending):")
-            for i, c in enumerate(todo[:20], 1):
+            for i, c in enumerate(todo, 1):
                 print(f"{i:2d}. {c}  —  {null_counts[c]} missing")
             print("b. Bulk-fill a column  |  e. Edit row-by-row  |  q. Write & quit")
             choice = input("> ").strip().lower()
@@ -201,9 +321,9 @@ def main():
                 idx = input("Select column number to bulk-fill: ").strip()
                 try:
                     k = int(idx)-1
-                    if 0 <= k < len(todo[:20]):
+                    if 0 <= k < len(todo):
                         col = todo[k]
-                        bulk_fill(df, col)
+                        null_counts[col] -= bulk_fill(df, col)
                     else:
                         print("Out of range.")
                 except ValueError:
@@ -215,6 +335,7 @@ def main():
                     print("Out of range.")
                     continue
                 row = df.loc[row_idx]
+                updates = {}
                 print(f"\\nEditing row {row_idx}:")
                 for c in df.columns:
                     cur = row.get(c, None)
@@ -223,11 +344,11 @@ def main():
                     ans = input("  New value (Enter=skip): ").strip()
                     if ans != "":
                         if c in ENUM_COLUMNS:
-                            ok = coerce_enum(ans, ENUM_COLUMNS[c])
+                            ok = coerce_enum(ans, _ENUM_LUT[c])
                             if ok is None:
                                 print(f"  Invalid (allowed {ENUM_COLUMNS[c]}), skipping.")
                             else:
-                                df.at[row_idx, c] = ok
+                                updates[c] = ok
                         elif "email" in c and not is_email(ans):
                             print("  Invalid email, skipping.")
                         elif ("date" in c or "time_coverage" in c or "status_last_updated" in c) and not is_date(ans):
@@ -235,22 +356,29 @@ def main():
                         elif "url" in c and not is_url(ans):
                             print("  Invalid URL, must start with http(s)://")
                         else:
-                            df.at[row_idx, c] = ans
-                # recompute quality_total for this row
-                if "quality_total (0-21)" in df.columns:
-                    df.at[row_idx, "quality_total (0-21)"] = compute_quality_total(df.loc[row_idx])
+                            updates[c] = ans
+                if not updates:
+                    continue
+                # apply all accepted values in one go; numeric columns are relaxed to hold text
+                cols = list(updates)
+                rigid = [c for c in cols if df[c].dtype != object and not pd.api.types.is_string_dtype(df[c].dtype)]
+                if rigid:
+                    df[rigid] = df[rigid].astype(object)
+                df.loc[row_idx, cols] = list(updates.values())
+                null_counts[cols] -= row[cols].isna().astype(int)
+                # recompute quality_total for this row if a score changed
+                if "quality_total (0-21)" in df.columns and any(c in QUALITY_COLUMNS for c in cols):
+                    scores = {c: updates.get(c, row[c]) for c in QUALITY_COLUMNS}
+                    df.at[row_idx, "quality_total (0-21)"] = compute_quality_totals(pd.DataFrame([scores])).iloc[0]
 
             else:
                 print("Unknown option.")
     # Write output, preserving other sheets
-    with pd.ExcelWriter(out_path, engine="xlsxwriter") as writer:
-        # Write original sheets
-        for name in xls.sheet_names:
-            if name == args.sheet:
-                continue
-            xls.parse(name).to_excel(writer, sheet_name=name, index=False)
-        # Write updated inventory
-        df.to_excel(writer, sheet_name=args.sheet, index=False)
+    book, header_fmt = open_output(out_path, wb, args.sheet)
+    # Write updated inventory
+    write_frame(book.add_worksheet(args.sheet), df, header_fmt=header_fmt)
+    book.close()
+    wb.close()
     print(f"\\nSaved: {out_path}")
 if __name__ == "__main__":
     main()
@@ -29,12 +29,8 @@ eurostat_entry = {
     'Notes': 'Modal split = % distribution of freight across transport modes. Cleaned using clean_eurostat.py. Belgium shows 10-11% IWW usage (strong). Overall EU trend declining -5.6% from 2005-2023.'
 }
 
-# Delete existing entry if present (avoid interactive prompt)
-if 'ESTAT_HV_001' in inventory.df['Source ID'].values:
-    inventory.df = inventory.df[inventory.df['Source ID'] != 'ESTAT_HV_001']
-
-# Add entry
-inventory.add_entry(eurostat_entry)
+# Add entry, replacing any existing one in place (avoids interactive prompt)
+inventory.upsert(eurostat_entry)
 inventory.save()
 
 print("\n✓ Inventory updated with complete Eurostat entry")
@@ -21,12 +21,21 @@ Manages a streamlined inventory with these fields:
 """
 
 import argparse
+import csv
+import os
 import sys
 from pathlib import Path
 from datetime import date
 from typing import Optional, List, Dict
+import openpyxl
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401  (multithreaded CSV parser, Parquet support)
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = 'c'
+
 
 class SimpleInventory:
     """Manage simplified data source inventory"""
@@ -96,8 +105,11 @@ class SimpleInventory:
             print(f"Loading inventory from: {self.inventory_path}")
             if self.inventory_path.suffix == '.xlsx':
                 self.df = pd.read_excel(self.inventory_path)
+            elif self.inventory_path.suffix == '.parquet':
+                self.df = pd.read_parquet(self.inventory_path)
             else:
-                self.df = pd.read_csv(self.inventory_path)
+                # All fields are text; read them as strings so empty columns stay writable
+                self.df = pd.read_csv(self.inventory_path, engine=_CSV_ENGINE, dtype='string')
             print(f"  Loaded {len(self.df)} entries")
         else:
             print("Creating new inventory...")
@@ -109,6 +121,8 @@ class SimpleInventory:
 
         if self.inventory_path.suffix == '.xlsx':
             self.df.to_excel(self.inventory_path, index=False)
+        elif self.inventory_path.suffix == '.parquet':
+            self.df.to_parquet(self.inventory_path, index=False, compression='zstd')
         else:
             self.df.to_csv(self.inventory_path, index=False)
 
@@ -131,13 +145,124 @@ class SimpleInventory:
                     print("Cancelled.")
                     return False
 
-        # Add entry
-        new_row = pd.DataFrame([entry])
-        self.df = pd.concat([self.df, new_row], ignore_index=True)
+        # Add entry by setting with enlargement (use add_entries to add many rows in one copy)
+        self._append_row(entry)
 
         print(f"✓ Added: {entry.get('Source ID', 'NEW')} - {entry.get('Source Name', 'Unnamed')}")
         return True
 
+    def add_entries(self, entries: List[Dict[str, str]]) -> int:
+        """Add many entries at once, skipping Source IDs already in the inventory"""
+        existing = set(self.df['Source ID'].dropna())
+        new = []
+        for entry in entries:
+            if entry.get('Source ID') in existing:
+                print(f"Warning: Source ID '{entry['Source ID']}' already exists, skipped")
+            else:
+                new.append(entry)
+
+        if new:
+            self.df = pd.concat([self.df, pd.DataFrame(new)], ignore_index=True)
+
+        print(f"✓ Added {len(new)} entries")
+        return len(new)
+
+    def append_raw(self, entry: Dict[str, str]) -> bool:
+        """Append one entry straight to the CSV/XLSX file without loading the inventory"""
+        # Returns False (nothing written) when the full load path is needed:
+        # Parquet storage, a duplicate Source ID, or a field the file has no column for
+        suffix = self.inventory_path.suffix
+        if suffix == '.parquet':
+            return False
+
+        source_id = entry.get('Source ID')
+        exists = self.inventory_path.exists()
+
+        if suffix == '.xlsx':
+            if exists:
+                wb = openpyxl.load_workbook(self.inventory_path)
+                ws = wb.worksheets[0]
+                header = [c.value for c in ws[1]]
+            else:
+                wb = openpyxl.Workbook()
+                ws = wb.active
+                ws.title = 'Sheet1'
+                header = list(self.FIELDS)
+                ws.append(header)
+            if any(k not in header for k in entry):
+                return False
+            if source_id is not None and 'Source ID' in header:
+                col = header.index('Source ID') + 1
+                ids = ws.iter_rows(min_row=2, min_col=col, max_col=col, values_only=True)
+                if any(v == source_id for (v,) in ids):
+                    return False
+            ws.append([entry.get(f) for f in header])
+            wb.save(self.inventory_path)
+        else:
+            header, needs_newline = list(self.FIELDS), False
+            if exists:
+                with open(self.inventory_path, newline='', encoding='utf-8') as f:
+                    reader = csv.reader(f)
+                    header = next(reader, [])
+                    if source_id is not None and 'Source ID' in header:
+                        col = header.index('Source ID')
+                        if any(len(row) > col and row[col] == source_id for row in reader):
+                            return False
+                # Make sure the new row starts on its own line
+                with open(self.inventory_path, 'rb') as f:
+                    if f.seek(0, os.SEEK_END):
+                        f.seek(-1, os.SEEK_END)
+                        needs_newline = f.read(1) not in (b'\n', b'\r')
+            if any(k not in header for k in entry):
+                return False
+
+            with open(self.inventory_path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, lineterminator=os.linesep)
+                if needs_newline:
+                    f.write(os.linesep)
+                if not exists:
+                    writer.writerow(header)
+                writer.writerow([entry.get(f, '') for f in header])
+
+        print(f"Appended to inventory: {self.inventory_path}")
+        print(f"✓ Added: {source_id or 'NEW'} - {entry.get('Source Name', 'Unnamed')}")
+        return True
+
+    def upsert(self, entry: Dict[str, str]):
+        """Add an entry, or replace the one with the same Source ID in place (no prompt)"""
+        source_id = entry['Source ID']
+        hits = self.df.index[self.df['Source ID'].eq(source_id).fillna(False)]
+
+        if len(hits) == 0:
+            self._append_row(entry)
+            print(f"✓ Added: {source_id} - {entry.get('Source Name', 'Unnamed')}")
+            return
+
+        # Overwrite the first match field by field (fields missing from entry become empty);
+        # keys without a column get one, as they would when appending
+        new_cols = [c for c in entry if c not in self.df.columns]
+        if new_cols:
+            self.df = self.df.reindex(columns=list(self.df.columns) + new_cols)
+        self._relax_columns(self.df.columns)
+        self.df.loc[hits[0]] = pd.Series(entry).reindex(self.df.columns)
+        if len(hits) > 1:
+            self.df = self.df.drop(hits[1:])
+        print(f"✓ Updated: {source_id} - {entry.get('Source Name', 'Unnamed')}")
+
+    def _relax_columns(self, columns):
+        """Cast columns inferred as numeric (e.g. all-empty in the CSV) to object so they can hold text"""
+        rigid = [c for c in columns if c in self.df.columns
+                 and self.df[c].dtype != object and not pd.api.types.is_string_dtype(self.df[c].dtype)]
+        if rigid:
+            self.df[rigid] = self.df[rigid].astype(object)
+
+    def _append_row(self, entry: Dict[str, str]):
+        """Append one entry as a new row (enlarging via .loc reallocates every column)"""
+        self._relax_columns(entry)
+        # Index may have gaps after deletions, so take the next free label
+        label = self.df.index.max() + 1 if len(self.df) else 0
+        self.df.loc[label, list(entry)] = list(entry.values())
+
     def _interactive_entry(self, initial_data: Dict = None) -> Dict[str, str]:
         """Interactively collect entry data"""
         if initial_data is None:
@@ -287,11 +412,10 @@ class SimpleInventory:
         """Search inventory by keyword"""
         print(f"\nSearching for: '{keyword}'")
 
-        # Search across all text fields
-        mask = self.df.astype(str).apply(
-            lambda row: row.str.contains(keyword, case=False, na=False).any(),
-            axis=1
-        )
+        # Search across all text fields: one literal substring match per column, OR-ed together
+        mask = pd.Series(False, index=self.df.index)
+        for col in self.df.select_dtypes(include=['object', 'string']).columns:
+            mask |= self.df[col].astype('string').str.contains(keyword, case=False, na=False, regex=False)
 
         results = self.df[mask]
 
@@ -349,7 +473,7 @@ def main():
         '--inventory',
         type=Path,
         default=Path('data_inventory.csv'),
-        help='Path to inventory file (default: data_inventory.csv)'
+        help='Path to inventory file: .csv, .xlsx or .parquet (default: data_inventory.csv)'
     )
 
     subparsers = parser.add_subparsers(dest='command', help='Commands')
@@ -398,11 +522,9 @@ def main():
         inventory.export_template(args.output)
         return 0
 
-    # Load inventory
     inventory = SimpleInventory(args.inventory)
-    inventory.load()
 
-    # Execute command
+    # Non-interactive add appends straight to the file; other commands need the loaded inventory
     if args.command == 'add':
         initial_data = {
             'Source ID': args.source_id,
@@ -416,8 +538,16 @@ def main():
         }
         # Remove None values
         initial_data = {k: v for k, v in initial_data.items() if v is not None}
+        interactive = args.interactive or len(initial_data) == 0
+        if not interactive and inventory.append_raw(initial_data):
+            return 0
+
+    # Load inventory
+    inventory.load()
 
-        if inventory.add_entry(initial_data, interactive=args.interactive or len(initial_data) == 0):
+    # Execute command
+    if args.command == 'add':
+        if inventory.add_entry(initial_data, interactive=interactive):
             inventory.save()
 
     elif args.command == 'list':
@@ -16,12 +16,145 @@ Usage examples:
   python tsv_to_csv.py input.tsv -o output.csv --process
 """
 
+from __future__ import annotations
+
 import argparse
 import csv
+import io
+import mmap
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
-import pandas as pd
+from typing import List, Dict, Any, Optional
+
+# numpy, pandas and pyarrow are only needed for --process; they are imported on
+# first use (see _import_analysis_libs) so plain conversions start fast
+np = pd = pa = pc = pa_csv = None
+
+
+def _import_analysis_libs():
+    """Import numpy, pandas and (optionally) pyarrow into the module namespace."""
+    global np, pd, pa, pc, pa_csv
+    if pd is not None:
+        return
+    import numpy as np
+    import pandas as pd
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        pa = pc = pa_csv = None
+
+
+CHUNK_SIZE = 1 << 22  # 4 MiB blocks (and file buffers) for the conversion
+ARROW_BLOCK_SIZE = 1 << 23  # files larger than one 8 MiB block are scanned with pyarrow
+SMALL_FILE_SIZE = 1 << 16  # TSVs under 64 KiB are converted in batches by one worker
+SMALL_FILE_BATCH = 256
+PREVIEW_COLUMNS = 20  # wide tables only show their first columns in the row preview
+
+
+def _quote_fields(data: bytes) -> Optional[bytes]:
+    """
+    Quote every tab/newline-delimited field that contains a comma or a quote.
+
+    Embedded quotes are doubled, as csv.writer does. Returns None without numpy.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    buf = np.frombuffer(data, dtype=np.uint8)
+    seps = np.flatnonzero((buf == ord('\t')) | (buf == ord('\n')))
+    seps = np.append(seps, len(buf))
+    quotes = np.flatnonzero(buf == ord('"'))
+    # Index of the separator closing each special character's field (sorted, so k is too)
+    k = np.searchsorted(seps, np.flatnonzero((buf == ord(',')) | (buf == ord('"'))))
+    k = k[np.r_[True, k[1:] != k[:-1]]]
+    starts = np.where(k > 0, seps[k - 1] + 1, 0)
+    return np.insert(buf, np.concatenate([starts, seps[k], quotes]), ord('"')).tobytes()
+
+
+def _copy_rows(src, dst, encoding: str) -> int:
+    """Copy rows from a binary TSV stream to a binary CSV stream with the csv module."""
+    text_src = io.TextIOWrapper(src, encoding=encoding, newline='')
+    text_dst = io.TextIOWrapper(dst, encoding=encoding, newline='', write_through=False)
+    csv_writer = csv.writer(text_dst)
+    row_count = 0
+    for row in csv.reader(text_src, delimiter='\t'):
+        csv_writer.writerow(row)
+        row_count += 1
+    # Detach so the caller's binary streams stay open when the wrappers are collected
+    text_dst.detach()
+    text_src.detach()
+    return row_count
+
+
+def _translate_tsv(tsv_path: Path, csv_path: Path, encoding: str) -> Optional[int]:
+    """
+    Convert TSV to CSV with bulk byte replacement instead of per-row parsing.
+
+    Handles the common case (no quoted fields, no bare CRs) block by block,
+    producing the same bytes as the csv module; quote characters inside a field
+    are literal to csv.reader and are simply escaped. From the first block that
+    needs real parsing on, the rest of the file is handed to the csv module.
+
+    Returns:
+        Number of rows written, or None if the encoding is not ASCII-compatible
+    """
+    try:
+        if '\t,"\r\n'.encode(encoding) != b'\t,"\r\n':
+            return None
+    except LookupError:
+        return None
+
+    row_count = 0
+    with open(tsv_path, 'rb') as src, open(csv_path, 'wb', buffering=CHUNK_SIZE) as dst:
+        size = os.fstat(src.fileno()).st_size
+        if size == 0:
+            return 0  # mmap cannot map an empty file
+        # Reserve roughly the output size up front so large outputs are not fragmented
+        reserved = size > CHUNK_SIZE and hasattr(os, 'posix_fallocate')
+        if reserved:
+            try:
+                os.posix_fallocate(dst.fileno(), 0, size)
+            except OSError:
+                reserved = False  # filesystem without fallocate support
+        # Map the input so blocks are sliced straight out of the page cache
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offset = 0
+            while offset < size:
+                end = offset + CHUNK_SIZE
+                if end < size:
+                    # Only hand over complete lines; a line longer than a block is taken whole
+                    end = mm.rfind(b'\n', offset, end) + 1 or mm.find(b'\n', end) + 1 or size
+                else:
+                    end = size
+
+                data = mm[offset:end]
+                if b'\r' in data:
+                    data = data.replace(b'\r\n', b'\n')
+                # Fields opening with a quote, bare CRs (or no numpy to quote fields): csv module from here on
+                fallback = b'\r' in data or data.startswith(b'"') or b'\t"' in data or b'\n"' in data
+                if not fallback and (b',' in data or b'"' in data):
+                    data = _quote_fields(data)
+                    fallback = data is None
+                if fallback:
+                    src.seek(offset)
+                    row_count += _copy_rows(src, dst, encoding)
+                    break
+
+                data.decode(encoding)  # same validation as reading in text mode
+                if not data.endswith(b'\n'):
+                    data += b'\n'
+                row_count += data.count(b'\n')
+                dst.write(data.replace(b'\t', b',').replace(b'\n', b'\r\n'))
+                offset = end
+        if reserved:
+            dst.truncate()  # drop any reserved space past the data actually written
+
+    return row_count
 
 
 def convert_tsv_to_csv(tsv_path: Path, csv_path: Path, encoding: str = 'utf-8') -> bool:
@@ -39,18 +172,13 @@ def convert_tsv_to_csv(tsv_path: Path, csv_path: Path, encoding: str = 'utf-8')
     try:
         print(f"Converting: {tsv_path} -> {csv_path}")
 
-        # Read TSV file
-        with open(tsv_path, 'r', encoding=encoding, newline='') as tsv_file:
-            tsv_reader = csv.reader(tsv_file, delimiter='\t')
-
-            # Write CSV file
-            with open(csv_path, 'w', encoding=encoding, newline='') as csv_file:
-                csv_writer = csv.writer(csv_file)
+        # Fast path: byte-level translation for ASCII-compatible encodings
+        row_count = _translate_tsv(tsv_path, csv_path, encoding)
 
-                row_count = 0
-                for row in tsv_reader:
-                    csv_writer.writerow(row)
-                    row_count += 1
+        if row_count is None:
+            with open(tsv_path, 'rb', buffering=CHUNK_SIZE) as tsv_file:
+                with open(csv_path, 'wb', buffering=CHUNK_SIZE) as csv_file:
+                    row_count = _copy_rows(tsv_file, csv_file, encoding)
 
         print(f"  ✓ Converted {row_count} rows successfully")
         return True
@@ -60,76 +188,341 @@ def convert_tsv_to_csv(tsv_path: Path, csv_path: Path, encoding: str = 'utf-8')
         return False
 
 
-def process_csv_file(csv_path: Path, encoding: str = 'utf-8') -> Dict[str, Any]:
+def _combine_dtypes(a, b):
+    """Dtype a column would get if both chunks had been parsed together."""
+    if a == b:
+        return a
+    if pd.api.types.is_numeric_dtype(a) and pd.api.types.is_numeric_dtype(b) \
+            and not pd.api.types.is_bool_dtype(a) and not pd.api.types.is_bool_dtype(b):
+        return np.result_type(a, b)
+    # Mixed text/number columns end up as text (object or string)
+    return b if pd.api.types.is_numeric_dtype(a) else a
+
+
+_moments_kernel = None
+NUMBA_MIN_ROWS = 100_000  # below this, compiling/loading the kernel costs more than it saves
+
+
+def _get_moments_kernel():
+    """Numba kernel for _chunk_moments, compiled (or loaded from cache) on first use; None without numba."""
+    global _moments_kernel
+    if _moments_kernel is None:
+        try:
+            import numba  # imported lazily: only large files pay for it
+        except ImportError:
+            _moments_kernel = False
+        else:
+            @numba.njit(parallel=True, cache=True)
+            def kernel(values):
+                """Single pass per column: count, mean, M2 (Welford), min, max; NaNs skipped"""
+                n_rows, n_cols = values.shape
+                out = np.full((n_cols, 5), np.nan)
+                for j in numba.prange(n_cols):
+                    n, mean, m2 = 0, 0.0, 0.0
+                    lo, hi = np.inf, -np.inf
+                    for i in range(n_rows):
+                        x = values[i, j]
+                        if x == x:
+                            n += 1
+                            d = x - mean
+                            mean += d / n
+                            m2 += d * (x - mean)
+                            lo = min(lo, x)
+                            hi = max(hi, x)
+                    out[j, 0] = n
+                    if n > 0:
+                        out[j, 1], out[j, 2], out[j, 3], out[j, 4] = mean, m2, lo, hi
+                return out
+            _moments_kernel = kernel
+    return _moments_kernel or None
+
+
+def _chunk_moments(numeric: pd.DataFrame) -> pd.DataFrame:
+    """Per-column count, mean, sum of squared deviations (M2), min and max."""
+    kernel = _get_moments_kernel() if len(numeric) >= NUMBA_MIN_ROWS and len(numeric.columns) else None
+    if kernel is not None:
+        # Column-major copy so each column is one contiguous run for the kernel
+        values = np.asfortranarray(numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+        return pd.DataFrame(kernel(values), index=numeric.columns, columns=['n', 'mean', 'm2', 'min', 'max'])
+
+    count = numeric.count()
+    return pd.DataFrame({
+        'n': count,
+        'mean': numeric.mean(),
+        'm2': numeric.var(ddof=0) * count,
+        'min': numeric.min(),
+        'max': numeric.max(),
+    })
+
+
+def _merge_moments(a: pd.DataFrame, b: pd.DataFrame) -> pd.DataFrame:
+    """Combine two sets of running moments (Chan et al. parallel variance update)."""
+    a, b = a.align(b)
+    na, nb = a['n'].fillna(0), b['n'].fillna(0)
+    n = na + nb
+    delta = b['mean'].fillna(0) - a['mean'].fillna(0)
+    return pd.DataFrame({
+        'n': n,
+        'mean': a['mean'].fillna(0) + delta * nb / n,
+        'm2': a['m2'].fillna(0) + b['m2'].fillna(0) + delta ** 2 * na * nb / n,
+        'min': np.fmin(a['min'], b['min']),
+        'max': np.fmax(a['max'], b['max']),
+    })
+
+
+def _estimate_memory(frame: pd.DataFrame, sample: int = 1000) -> int:
+    """
+    Approximate frame.memory_usage(deep=True).sum() without visiting every string.
+
+    Fixed-width and Arrow-backed columns report their buffer sizes directly; columns of
+    Python objects are measured on the first `sample` rows and scaled up.
+    """
+    total = frame.index.memory_usage()
+    n = len(frame)
+    for col, dtype in frame.dtypes.items():
+        series = frame[col]
+        if dtype == object or getattr(dtype, 'storage', None) == 'python':
+            head = series.iloc[:sample]
+            if len(head):
+                total += int(head.memory_usage(deep=True, index=False) * n / len(head))
+        else:
+            total += series.memory_usage(index=False)
+    return total
+
+
+def _scan_pandas(csv_path: Path, encoding: str, chunksize: int) -> Dict[str, Any]:
+    """Stream the CSV through pandas' C parser, keeping running aggregates."""
+    rows, n_chunks, memory_usage = 0, 0, 0
+    first = dtypes = null_counts = moments = None
+    with pd.read_csv(csv_path, encoding=encoding, chunksize=chunksize) as reader:
+        for chunk in reader:
+            n_chunks += 1
+            rows += len(chunk)
+            memory_usage += _estimate_memory(chunk)
+            nulls = chunk.isnull().sum()
+            stats = _chunk_moments(chunk.select_dtypes(include=['number']))
+            if first is None:
+                first, dtypes, null_counts, moments = chunk, chunk.dtypes, nulls, stats
+            else:
+                dtypes = pd.Series({c: _combine_dtypes(dtypes[c], t) for c, t in chunk.dtypes.items()})
+                null_counts = null_counts + nulls
+                moments = _merge_moments(moments, stats)
+
+    numeric_cols = [c for c in first.columns if c in moments.index
+                    and pd.api.types.is_numeric_dtype(dtypes[c]) and not pd.api.types.is_bool_dtype(dtypes[c])]
+    return {
+        'rows': rows,
+        'column_names': list(first.columns),
+        'dtypes': dtypes,
+        'null_counts': null_counts,
+        'memory_usage': memory_usage,
+        'preview': first.head(),
+        'numeric_cols': numeric_cols,
+        'moments': moments,
+        # Exact describe() (with quartiles) when the whole file was a single chunk
+        'describe': first[numeric_cols].describe() if n_chunks == 1 and numeric_cols else None,
+    }
+
+
+def _arrow_dtype_name(arrow_type, has_nulls: bool) -> str:
+    """Name of the dtype pandas' read_csv would infer for an Arrow-inferred column."""
+    if pa.types.is_integer(arrow_type):
+        return 'float64' if has_nulls else 'int64'
+    if pa.types.is_floating(arrow_type) or pa.types.is_null(arrow_type):
+        return 'float64'
+    if pa.types.is_boolean(arrow_type):
+        return 'object' if has_nulls else 'bool'
+    return str(pd.Series(['']).dtype)  # text (also for dates, which pandas does not parse)
+
+
+def _scan_arrow(csv_path: Path, encoding: str, chunksize: int) -> Dict[str, Any]:
+    """
+    Stream the CSV through pyarrow's multithreaded reader without building DataFrames.
+
+    Row and null counts come straight from the Arrow arrays and numeric moments
+    from pyarrow.compute. The numeric columns are kept while the file fits in
+    chunksize rows, so an exact describe() can be reported as on the pandas path.
+    Raises pa.ArrowInvalid if a later block does not fit the types inferred from
+    the first one.
+    """
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(encoding=encoding, block_size=ARROW_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+    )
+    schema = reader.schema
+    names = schema.names
+    # All-empty columns (Arrow null type) are float64 in pandas, so they count as numeric
+    numeric = [i for i, f in enumerate(schema)
+               if pa.types.is_integer(f.type) or pa.types.is_floating(f.type) or pa.types.is_null(f.type)]
+
+    rows, memory_usage = 0, 0
+    nulls = np.zeros(len(names), dtype=np.int64)
+    head, kept, moments = [], [], None
+    for batch in reader:
+        rows += batch.num_rows
+        memory_usage += batch.nbytes
+        nulls += [col.null_count for col in batch.columns]
+        if sum(b.num_rows for b in head) < 5:
+            head.append(batch.slice(0, 5))
+        if kept is not None:
+            kept = kept + [batch.select(numeric)] if rows <= chunksize else None
+        stats = {}
+        for i in numeric:
+            col = batch.column(i)
+            if pa.types.is_null(col.type):
+                stats[names[i]] = {'n': 0}
+                continue
+            n = len(col) - col.null_count
+            min_max = pc.min_max(col)
+            stats[names[i]] = {
+                'n': n,
+                'mean': pc.mean(col).as_py(),
+                'm2': (pc.variance(col, ddof=0).as_py() or 0) * n,
+                'min': min_max['min'].as_py(),
+                'max': min_max['max'].as_py(),
+            }
+        stats = pd.DataFrame.from_dict(stats, orient='index', columns=['n', 'mean', 'm2', 'min', 'max'], dtype=float)
+        moments = stats if moments is None else _merge_moments(moments, stats)
+
+    null_counts = pd.Series(nulls, index=names)
+    preview = pa.Table.from_batches(head, schema=schema).slice(0, 5).to_pandas() if head \
+        else pd.DataFrame(columns=names)
+    for f in schema:
+        if pa.types.is_null(f.type):
+            preview[f.name] = preview[f.name].astype(float)
+
+    describe = None
+    if kept is not None and numeric:
+        # Whole file within one chunk: exact describe() with quartiles
+        table = pa.Table.from_batches(kept, schema=pa.schema([schema.field(i) for i in numeric]))
+        describe = table.to_pandas().astype(float).describe()
+    return {
+        'rows': rows,
+        'column_names': names,
+        'dtypes': pd.Series({f.name: _arrow_dtype_name(f.type, null_counts[f.name] > 0) for f in schema}),
+        'null_counts': null_counts,
+        'memory_usage': memory_usage,
+        'preview': preview,
+        'numeric_cols': [names[i] for i in numeric],
+        'moments': moments,
+        'describe': describe,
+    }
+
+
+def process_csv_file(csv_path: Path, encoding: str = 'utf-8', chunksize: int = 500_000,
+                     return_info: bool = True) -> Optional[Dict[str, Any]]:
     """
     Process and analyze a CSV file.
 
+    The file is streamed in chunks, so memory use is bounded by the chunk size.
+    Files larger than one Arrow block are scanned with pyarrow when it is installed.
+    Numeric quartiles are only reported when the file fits in a single chunk (either reader).
+
     Args:
         csv_path: Path to CSV file
         encoding: File encoding (default: utf-8)
+        chunksize: Rows per chunk for the pandas reader (default: 500000)
+        return_info: Build and return the analysis dictionary (default: True);
+            the CLI only prints the report and passes False
 
     Returns:
-        Dictionary with file analysis information
+        Dictionary with file analysis information, or None if return_info is False
     """
     try:
+        _import_analysis_libs()
         print(f"\n=== Processing CSV: {csv_path} ===")
 
-        # Read CSV using pandas for better analysis
-        df = pd.read_csv(csv_path, encoding=encoding)
+        scan = None
+        if pa_csv is not None and csv_path.stat().st_size > ARROW_BLOCK_SIZE:
+            try:
+                scan = _scan_arrow(csv_path, encoding, chunksize)
+            except pa.ArrowInvalid:
+                scan = None  # column types change mid-file; let pandas infer them
+        if scan is None:
+            scan = _scan_pandas(csv_path, encoding, chunksize)
 
-        info = {
-            'file': str(csv_path),
-            'rows': len(df),
-            'columns': len(df.columns),
-            'column_names': list(df.columns),
-            'dtypes': df.dtypes.to_dict(),
-            'null_counts': df.isnull().sum().to_dict(),
-            'memory_usage': df.memory_usage(deep=True).sum()
-        }
+        # Null counts and dtypes are computed once during the scan and reused below
+        dtypes, null_counts = scan['dtypes'], scan['null_counts']
 
         # Display information
         print(f"\nFile: {csv_path}")
-        print(f"Rows: {info['rows']}")
-        print(f"Columns: {info['columns']}")
-        print(f"Memory usage: {info['memory_usage'] / 1024:.2f} KB")
+        print(f"Rows: {scan['rows']}")
+        print(f"Columns: {len(scan['column_names'])}")
+        print(f"Memory usage (est.): {scan['memory_usage'] / 1024:.2f} KB")
 
         print("\nColumn Information:")
         print("-" * 80)
         print(f"{'Column Name':<40} {'Type':<15} {'Null Count':<10}")
         print("-" * 80)
 
-        for col in df.columns:
-            dtype = str(df[col].dtype)
-            null_count = df[col].isnull().sum()
+        for col in scan['column_names']:
+            dtype = str(dtypes[col])
+            null_count = null_counts[col]
             print(f"{col:<40} {dtype:<15} {null_count:<10}")
 
         # Show first few rows
         print("\nFirst 5 rows preview:")
         print("-" * 80)
-        print(df.head().to_string())
+        preview = scan['preview']
+        print(preview.iloc[:, :PREVIEW_COLUMNS].to_string())
+        if preview.shape[1] > PREVIEW_COLUMNS:
+            print(f"... ({preview.shape[1] - PREVIEW_COLUMNS} more columns hidden)")
 
         # Basic statistics for numeric columns
-        numeric_cols = df.select_dtypes(include=['number']).columns
+        numeric_cols = scan['numeric_cols']
         if len(numeric_cols) > 0:
             print("\nNumeric column statistics:")
             print("-" * 80)
-            print(df[numeric_cols].describe().to_string())
-
-        return info
+            if scan['describe'] is not None:
+                print(scan['describe'].to_string())
+            else:
+                m = scan['moments'].loc[numeric_cols]
+                describe = pd.DataFrame({
+                    'count': m['n'],
+                    'mean': m['mean'],
+                    'std': np.sqrt(m['m2'] / (m['n'] - 1)),
+                    'min': m['min'],
+                    'max': m['max'],
+                }).T
+                print(describe.to_string())
+                print("(quartiles omitted for files larger than one chunk)")
+
+        if not return_info:
+            return None
+        return {
+            'file': str(csv_path),
+            'rows': scan['rows'],
+            'columns': len(scan['column_names']),
+            'column_names': scan['column_names'],
+            'dtypes': dtypes.to_dict(),
+            'null_counts': null_counts.to_dict(),
+            'memory_usage': scan['memory_usage']
+        }
 
     except Exception as e:
         print(f"Error processing {csv_path}: {e}", file=sys.stderr)
-        return {}
+        return {} if return_info else None
 
 
-def convert_directory(directory: Path, output_dir: Path = None, encoding: str = 'utf-8') -> List[Path]:
+def _convert_batch(jobs: List[tuple], encoding: str) -> List[bool]:
+    """Convert a batch of (tsv_path, csv_path) pairs in one worker task."""
+    return [convert_tsv_to_csv(src, dst, encoding) for src, dst in jobs]
+
+
+def convert_directory(directory: Path, output_dir: Path = None, encoding: str = 'utf-8',
+                      max_workers: Optional[int] = None) -> List[Path]:
     """
     Convert all TSV files in a directory to CSV format.
 
+    Files are converted in parallel worker processes; small files are sent to
+    the workers in batches so task overhead does not dominate.
+
     Args:
         directory: Directory containing TSV files
         output_dir: Output directory (default: same as input)
         encoding: File encoding (default: utf-8)
+        max_workers: Number of worker processes (default: CPU count)
 
     Returns:
         List of created CSV file paths
@@ -143,7 +536,11 @@ def convert_directory(directory: Path, output_dir: Path = None, encoding: str =
     else:
         output_dir.mkdir(parents=True, exist_ok=True)
 
-    tsv_files = list(directory.glob('*.tsv')) + list(directory.glob('*.TSV'))
+    # One directory pass with a case-insensitive suffix check, sorted for a stable order
+    with os.scandir(directory) as entries:
+        sizes = {Path(entry.path): entry.stat(follow_symlinks=False).st_size for entry in entries
+                 if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith('.tsv')}
+    tsv_files = sorted(sizes)
 
     if not tsv_files:
         print(f"No TSV files found in {directory}")
@@ -151,13 +548,30 @@ def convert_directory(directory: Path, output_dir: Path = None, encoding: str =
 
     print(f"Found {len(tsv_files)} TSV file(s) in {directory}")
 
-    csv_files = []
+    # foo.tsv and foo.TSV both map to foo.csv; convert only the first so workers never race on it
+    jobs, targets = [], set()
     for tsv_file in tsv_files:
         csv_file = output_dir / f"{tsv_file.stem}.csv"
-        if convert_tsv_to_csv(tsv_file, csv_file, encoding):
-            csv_files.append(csv_file)
+        if csv_file in targets:
+            print(f"Warning: skipping {tsv_file}, another file already converts to {csv_file}", file=sys.stderr)
+            continue
+        targets.add(csv_file)
+        jobs.append((tsv_file, csv_file))
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+
+    if workers <= 1:
+        results = [convert_tsv_to_csv(src, dst, encoding) for src, dst in jobs]
+    else:
+        small = [job for job in jobs if sizes[job[0]] < SMALL_FILE_SIZE]
+        batches = [[job] for job in jobs if sizes[job[0]] >= SMALL_FILE_SIZE]
+        batches += [small[i:i + SMALL_FILE_BATCH] for i in range(0, len(small), SMALL_FILE_BATCH)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            done = executor.map(_convert_batch, batches, [encoding] * len(batches))
+            outcome = {dst: result for batch, batch_results in zip(batches, done)
+                       for (_, dst), result in zip(batch, batch_results)}
+        results = [outcome[dst] for _, dst in jobs]
 
-    return csv_files
+    return [dst for (_, dst), ok in zip(jobs, results) if ok]
 
 
 def main():
@@ -192,6 +606,12 @@ def main():
         help='Output directory for batch conversion (default: same as input)'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Worker processes for batch conversion (default: CPU count)'
+    )
+
     parser.add_argument(
         '--process',
         nargs='?',
@@ -217,7 +637,7 @@ def main():
 
     # Batch directory conversion
     if args.dir:
-        csv_files = convert_directory(args.dir, args.output_dir, args.encoding)
+        csv_files = convert_directory(args.dir, args.output_dir, args.encoding, args.jobs)
         if not csv_files:
             sys.exit(1)
 
@@ -238,11 +658,11 @@ def main():
     if args.process:
         # If process is a string (file path), process that specific file
         if isinstance(args.process, str) and args.process != True:
-            process_csv_file(Path(args.process), args.encoding)
+            process_csv_file(Path(args.process), args.encoding, return_info=False)
         # Otherwise, process the converted files
         elif csv_files:
             for csv_file in csv_files:
-                process_csv_file(csv_file, args.encoding)
+                process_csv_file(csv_file, args.encoding, return_info=False)
         else:
             print("Error: No CSV files to process", file=sys.stderr)
             sys.exit(1)
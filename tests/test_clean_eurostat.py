@@ -0,0 +1,36 @@
+"""Regression checks for the Eurostat metadata split (run: python -m unittest discover tests)"""
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from clean_eurostat import EurostatCleaner, split_metadata  # noqa: E402
+
+
+class SplitMetadataTest(unittest.TestCase):
+    def test_full_metadata(self):
+        meta = split_metadata(pd.Series(['A,PC,IWW,BE\\TIME_PERIOD', 'A,PC']))
+        self.assertEqual(meta.to_dict('records'), [{'freq': 'A', 'unit': 'PC', 'tra_mode': 'IWW', 'geo': 'BE'}])
+
+    def test_short_metadata_gives_no_rows(self):
+        # No cell has 4 fields: the split yields fewer columns than META_COLS
+        meta = split_metadata(pd.Series(['A,PC', 'A,T']))
+        self.assertEqual(list(meta.columns), ['freq', 'unit', 'tra_mode', 'geo'])
+        self.assertEqual(len(meta), 0)
+
+    def test_short_metadata_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / 'short.csv'
+            csv_path.write_text('"freq,unit\\TIME_PERIOD",2020 ,2021 \n"A,PC",1.5,2 e\n"A,T",3,:\n')
+            cleaner = EurostatCleaner(csv_path)
+            cleaner.load_data()
+            self.assertEqual(len(cleaner.clean_data()), 0)
+            self.assertEqual(len(cleaner.parse_metadata()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()